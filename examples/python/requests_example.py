@@ -6,13 +6,307 @@ with the Python requests library.
 
 Requirements:
     pip install requests
+    pip install orjson  # optional, faster JSON decoding
+    pip install requests-cache  # optional, persistent on-disk cache
+    pip install 'httpx[http2]'  # optional, HTTP/2 batch conversion
+    pip install aiohttp  # optional, asyncio batch conversion
 """
 
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.ssl_ import create_urllib3_context
+import certifi
 import json
-from datetime import datetime
-from typing import Optional, Dict, List, Tuple
+import logging
+import random
+import threading
 import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import takewhile
+from typing import Any, Optional, Dict, List, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================
+# SHARED SESSION AND URLS
+# ============================================
+
+_API_BASE = "https://sudhanparajuli.com.np/api"
+_URL_PATH = "/{ct}/{y}/{m}/{d}"
+
+# URL builder bound once; call with {'ct', 'y', 'm', 'd'} values
+_URL_TMPL = (_API_BASE + _URL_PATH).format_map
+
+# Default headers, set once on each client so no call passes headers=.
+# Accept-Encoding is left to the client; all of them already offer gzip.
+_HEADERS = {
+    'User-Agent': 'Nepali-Date-Converter-Python/1.0',
+    'Accept': 'application/json'
+}
+
+# One trust store for every requests session, parsed once at import
+_SSL_CTX = create_urllib3_context()
+_SSL_CTX.load_verify_locations(certifi.where())
+
+
+class _SharedSSLAdapter(HTTPAdapter):
+    """HTTPAdapter that verifies with the shared _SSL_CTX."""
+    
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(
+            request, verify, cert)
+        if verify is True:
+            pool_kwargs['ssl_context'] = _SSL_CTX
+        return host_params, pool_kwargs
+    
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        # Only when the pool really got _SSL_CTX (requests < 2.32 never asks
+        # build_connection_pool_key_attributes); a CA path would otherwise be
+        # reloaded into it on every new connection
+        if verify is True and conn.conn_kw.get('ssl_context') is _SSL_CTX:
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+
+# A single session keeps TLS connections alive between calls, so repeated
+# conversions skip the DNS + TCP + TLS handshake.
+_SESSION = requests.Session()
+_SESSION.headers.update(_HEADERS)
+_SESSION.mount('https://', _SharedSSLAdapter(
+    pool_connections=4,
+    pool_maxsize=20,
+    pool_block=False
+))
+
+# Optional HTTP/2 client: batch requests are multiplexed as streams on one
+# connection. Needs httpx with the h2 extra; otherwise batches use _SESSION.
+_CLIENT = None
+_FETCH_ERRORS: Tuple[type, ...] = (requests.RequestException,)
+if httpx is not None:
+    try:
+        _CLIENT = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=5, max_connections=20),
+            timeout=10.0,
+            headers=_HEADERS
+        )
+        _FETCH_ERRORS += (httpx.HTTPError,)
+    except ImportError:
+        pass
+
+
+def _warm_up() -> None:
+    """Open a keep-alive connection to the API host in the shared pool."""
+    try:
+        _SESSION.head(_API_BASE + '/', timeout=5)
+    except requests.RequestException as e:
+        logger.debug("Warm-up request failed: %s", e)
+
+
+def warm_up_connection() -> threading.Thread:
+    """
+    Resolve the API host and finish the TLS handshake in the background.
+    
+    Call this early (e.g. at application start-up) so the first conversion
+    that needs the API finds an idle connection in the pool.
+    
+    Returns:
+        The started daemon thread
+    """
+    thread = threading.Thread(target=_warm_up, name='api-warm-up', daemon=True)
+    thread.start()
+    return thread
+
+
+def _parse_json(response: requests.Response) -> Dict:
+    """
+    Decode a JSON response body straight from bytes.
+    
+    ``response.content`` is already gunzipped and is never decoded to str,
+    unlike ``response.json()``. Bodies are ~100 bytes, so streaming through
+    ``response.raw`` would only add overhead.
+    """
+    try:
+        return _json_loads(response.content)
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(e, response=response)
+
+
+# ============================================
+# LOCAL CONVERSION TABLE
+# ============================================
+
+# Days in each BS month (Baisakh..Chaitra) for the API's BS range. With
+# these, in-range conversions are plain date arithmetic and need no request.
+_BS_MONTH_LENGTHS: Dict[int, Tuple[int, ...]] = {
+    2000: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2001: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2002: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2003: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2004: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2005: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2006: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2007: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2008: (31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 29, 31),
+    2009: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2010: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2011: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2012: (31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30),
+    2013: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2014: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2015: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2016: (31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30),
+    2017: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2018: (31, 32, 31, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2019: (31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2020: (31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30),
+    2021: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2022: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30),
+    2023: (31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2024: (31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30),
+    2025: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2026: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2027: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2028: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2029: (31, 31, 32, 31, 32, 30, 30, 29, 30, 29, 30, 30),
+    2030: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2031: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2032: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2033: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2034: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2035: (30, 32, 31, 32, 31, 31, 29, 30, 30, 29, 29, 31),
+    2036: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2037: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2038: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2039: (31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30),
+    2040: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2041: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2042: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2043: (31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30),
+    2044: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2045: (31, 32, 31, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2046: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2047: (31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30),
+    2048: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2049: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30),
+    2050: (31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2051: (31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30),
+    2052: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2053: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30),
+    2054: (31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2055: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2056: (31, 31, 32, 31, 32, 30, 30, 29, 30, 29, 30, 30),
+    2057: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2058: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2059: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2060: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2061: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2062: (31, 31, 31, 32, 31, 31, 29, 30, 29, 30, 29, 31),
+    2063: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2064: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2065: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2066: (31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 29, 31),
+    2067: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2068: (31, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2069: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2070: (31, 31, 31, 32, 31, 31, 29, 30, 30, 29, 30, 30),
+    2071: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2072: (31, 32, 31, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2073: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 31),
+    2074: (31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30),
+    2075: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2076: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30),
+    2077: (31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2078: (31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30),
+    2079: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2080: (31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30),
+    2081: (31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31),
+    2082: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2083: (31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30),
+    2084: (31, 31, 32, 31, 31, 30, 30, 30, 29, 30, 30, 30),
+    2085: (31, 32, 31, 32, 30, 31, 30, 30, 29, 30, 30, 30),
+    2086: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 30, 30),
+    2087: (31, 31, 32, 31, 31, 31, 30, 29, 30, 30, 30, 30),
+    2088: (30, 31, 32, 32, 30, 31, 30, 30, 29, 30, 30, 30),
+    2089: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 30, 30),
+    2090: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 30, 30),
+    2091: (31, 31, 32, 31, 31, 31, 30, 30, 29, 30, 30, 30),
+    2092: (30, 31, 32, 32, 31, 30, 30, 30, 29, 30, 30, 30),
+    2093: (30, 32, 31, 32, 31, 30, 30, 30, 29, 30, 30, 30),
+    2094: (31, 31, 32, 31, 31, 30, 30, 30, 29, 30, 30, 30),
+    2095: (31, 31, 32, 31, 31, 31, 30, 29, 30, 30, 30, 30),
+    2096: (30, 31, 32, 32, 31, 30, 30, 29, 30, 29, 30, 30),
+    2097: (31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 30, 30),
+    2098: (31, 31, 32, 31, 31, 31, 29, 30, 29, 30, 29, 31),
+    2099: (31, 31, 32, 31, 31, 31, 30, 29, 29, 30, 30, 30),
+}
+
+# BS 2000/1/1 = AD 1943/4/14
+_BS_EPOCH_ORDINAL = date(1943, 4, 14).toordinal()
+
+# AD ordinal of BS New Year for each year in the table, plus one past the end
+_BS_YEARS = sorted(_BS_MONTH_LENGTHS)
+_BS_YEAR_STARTS = [_BS_EPOCH_ORDINAL]
+for _bs_year in _BS_YEARS:
+    _BS_YEAR_STARTS.append(_BS_YEAR_STARTS[-1] + sum(_BS_MONTH_LENGTHS[_bs_year]))
+del _bs_year
+
+
+def _local_bs_to_ad(year: int, month: int, day: int) -> Optional[Dict]:
+    """Convert BS to AD from the month table, or None if not covered."""
+    lengths = _BS_MONTH_LENGTHS.get(year)
+    if lengths is None or not (1 <= month <= 12) or not (1 <= day <= lengths[month - 1]):
+        return None
+    
+    ordinal = (_BS_YEAR_STARTS[year - _BS_YEARS[0]]
+               + sum(lengths[:month - 1]) + day - 1)
+    ad = date.fromordinal(ordinal)
+    return {'year': ad.year, 'month': ad.month, 'day': ad.day, 'type': 'AD'}
+
+
+def _local_ad_to_bs(year: int, month: int, day: int) -> Optional[Dict]:
+    """Convert AD to BS from the month table, or None if not covered."""
+    ordinal = date(year, month, day).toordinal()
+    if not (_BS_YEAR_STARTS[0] <= ordinal < _BS_YEAR_STARTS[-1]):
+        return None
+    
+    index = bisect_right(_BS_YEAR_STARTS, ordinal) - 1
+    bs_year = _BS_YEARS[index]
+    remaining = ordinal - _BS_YEAR_STARTS[index]
+    for bs_month, length in enumerate(_BS_MONTH_LENGTHS[bs_year], start=1):
+        if remaining < length:
+            break
+        remaining -= length
+    return {'year': bs_year, 'month': bs_month, 'day': remaining + 1, 'type': 'BS'}
 
 
 # ============================================
@@ -23,6 +317,8 @@ def convert_ad_to_bs(year: int, month: int, day: int) -> Optional[Dict]:
     """
     Convert Gregorian (AD) date to Bikram Sambat (BS) date.
     
+    Dates covered by the local month table are converted without a request.
+    
     Args:
         year: AD year (1943-2042)
         month: Month (1-12)
@@ -31,27 +327,35 @@ def convert_ad_to_bs(year: int, month: int, day: int) -> Optional[Dict]:
     Returns:
         Dictionary with converted date or None if failed
     """
-    url = f"https://sudhanparajuli.com.np/api/ad-to-bs/{year}/{month}/{day}"
+    if is_valid_ad_date(year, month, day):
+        bs_date = _local_ad_to_bs(year, month, day)
+        if bs_date is not None:
+            logger.debug("AD %s-%s-%s = BS %s-%s-%s", year, month, day,
+                         bs_date['year'], bs_date['month'], bs_date['day'])
+            return bs_date
+    
+    url = _URL_TMPL({'ct': 'ad-to-bs', 'y': year, 'm': month, 'd': day})
     
     try:
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         response.raise_for_status()  # Raise exception for bad status codes
         
-        data = response.json()
+        data = _parse_json(response)
         
         if data.get('success'):
             bs_date = data['result']
-            print(f"AD {year}-{month}-{day} = BS {bs_date['year']}-{bs_date['month']}-{bs_date['day']}")
+            logger.debug("AD %s-%s-%s = BS %s-%s-%s", year, month, day,
+                         bs_date['year'], bs_date['month'], bs_date['day'])
             return bs_date
         else:
-            print(f"Error: {data.get('error', 'Unknown error')}")
+            logger.warning("Error: %s", data.get('error', 'Unknown error'))
             return None
             
     except requests.Timeout:
-        print("Request timed out")
+        logger.warning("Request timed out")
         return None
     except requests.RequestException as e:
-        print(f"Request failed: {e}")
+        logger.warning("Request failed: %s", e)
         return None
 
 
@@ -63,6 +367,8 @@ def convert_bs_to_ad(year: int, month: int, day: int) -> Optional[Dict]:
     """
     Convert Bikram Sambat (BS) date to Gregorian (AD) date.
     
+    Dates covered by the local month table are converted without a request.
+    
     Args:
         year: BS year (2000-2099)
         month: Month (1-12)
@@ -71,27 +377,35 @@ def convert_bs_to_ad(year: int, month: int, day: int) -> Optional[Dict]:
     Returns:
         Dictionary with converted date or None if failed
     """
-    url = f"https://sudhanparajuli.com.np/api/bs-to-ad/{year}/{month}/{day}"
+    if is_valid_bs_date(year, month, day):
+        ad_date = _local_bs_to_ad(year, month, day)
+        if ad_date is not None:
+            logger.debug("BS %s-%s-%s = AD %s-%s-%s", year, month, day,
+                         ad_date['year'], ad_date['month'], ad_date['day'])
+            return ad_date
+    
+    url = _URL_TMPL({'ct': 'bs-to-ad', 'y': year, 'm': month, 'd': day})
     
     try:
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         response.raise_for_status()
         
-        data = response.json()
+        data = _parse_json(response)
         
         if data.get('success'):
             ad_date = data['result']
-            print(f"BS {year}-{month}-{day} = AD {ad_date['year']}-{ad_date['month']}-{ad_date['day']}")
+            logger.debug("BS %s-%s-%s = AD %s-%s-%s", year, month, day,
+                         ad_date['year'], ad_date['month'], ad_date['day'])
             return ad_date
         else:
-            print(f"Error: {data.get('error', 'Unknown error')}")
+            logger.warning("Error: %s", data.get('error', 'Unknown error'))
             return None
             
     except requests.Timeout:
-        print("Request timed out")
+        logger.warning("Request timed out")
         return None
     except requests.RequestException as e:
-        print(f"Request failed: {e}")
+        logger.warning("Request failed: %s", e)
         return None
 
 
@@ -99,18 +413,91 @@ def convert_bs_to_ad(year: int, month: int, day: int) -> Optional[Dict]:
 # 3. CONVERT TODAY'S DATE
 # ============================================
 
+@lru_cache(maxsize=8)
+def _cached_today_bs(date_ordinal: int) -> Dict:
+    """Convert an AD date ordinal; raises on failure so None is not cached."""
+    today = date.fromordinal(date_ordinal)
+    result = convert_ad_to_bs(today.year, today.month, today.day)
+    if result is None:
+        raise ConversionError(f"Could not convert {today.isoformat()}")
+    return result
+
+
 def convert_today_to_bs() -> Optional[Dict]:
-    """Convert today's date from AD to BS."""
-    today = datetime.now()
-    print(f"Converting today's date: {today.strftime('%Y-%m-%d')}")
+    """
+    Convert today's date from AD to BS.
+    
+    The result is cached per calendar day, so only the first call each
+    day does the conversion.
+    """
+    today = date.today()
+    logger.debug("Converting today's date: %s", today.strftime('%Y-%m-%d'))
     
-    return convert_ad_to_bs(today.year, today.month, today.day)
+    try:
+        return _cached_today_bs(today.toordinal())
+    except ConversionError:
+        return None
 
 
 # ============================================
 # 4. WITH RETRY LOGIC
 # ============================================
 
+# Longest single wait between retries, in seconds. Kept here rather than as
+# Retry(backoff_max=...), which urllib3 1.26 does not accept.
+_RETRY_WAIT_CAP = 30
+
+
+class _JitteredRetry(Retry):
+    """
+    Retry with jittered exponential backoff and a capped Retry-After.
+    
+    Every wait, including the first, is backoff_factor * 2**n scaled by a
+    random factor in [0.5, 1.5), so clients failing together don't retry
+    together. Both backoff and Retry-After waits are capped at
+    _RETRY_WAIT_CAP seconds.
+    """
+    
+    def get_backoff_time(self) -> float:
+        # Consecutive errors since the last redirect, as urllib3 counts them
+        errors = len(list(takewhile(lambda h: h.redirect_location is None,
+                                    reversed(self.history))))
+        backoff = self.backoff_factor * 2 ** max(1, errors)
+        return min(_RETRY_WAIT_CAP, backoff * (0.5 + random.random()))
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(_RETRY_WAIT_CAP, retry_after)
+
+
+_RETRY_SESSIONS: Dict[int, requests.Session] = {}
+
+
+def _get_retry_session(max_retries: int) -> requests.Session:
+    """Return a session whose adapter retries with backoff and jitter."""
+    session = _RETRY_SESSIONS.get(max_retries)
+    if session is None:
+        retry = _JitteredRetry(
+            total=max_retries,
+            backoff_factor=1.0,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True
+        )
+        session = requests.Session()
+        session.headers.update(_SESSION.headers)
+        session.mount('https://', _SharedSSLAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            pool_block=False,
+            max_retries=retry
+        ))
+        _RETRY_SESSIONS[max_retries] = session
+    return session
+
+
 def convert_with_retry(
     year: int, 
     month: int, 
@@ -121,6 +508,9 @@ def convert_with_retry(
     """
     Convert date with automatic retry on failure.
     
+    Retries are handled by urllib3 on the pooled connection: exponential
+    backoff with jitter, and Retry-After is honoured on 429/503.
+    
     Args:
         year: Year value
         month: Month value
@@ -131,33 +521,24 @@ def convert_with_retry(
     Returns:
         Converted date dictionary or None
     """
-    url = f"https://sudhanparajuli.com.np/api/{conversion_type}/{year}/{month}/{day}"
+    url = _URL_TMPL({'ct': conversion_type, 'y': year, 'm': month, 'd': day})
+    session = _get_retry_session(max_retries)
     
-    for attempt in range(1, max_retries + 1):
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get('success'):
-                return data['result']
-            else:
-                print(f"Attempt {attempt}: {data.get('error')}")
-                
-        except requests.RequestException as e:
-            print(f"Attempt {attempt} failed: {e}")
+    try:
+        response = session.get(url, timeout=10)
+        response.raise_for_status()
+        
+        data = _parse_json(response)
+        
+        if data.get('success'):
+            return data['result']
+        else:
+            logger.warning("Error: %s", data.get('error'))
+            return None
             
-            if attempt < max_retries:
-                # Exponential backoff
-                wait_time = 2 ** attempt
-                print(f"Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
-            else:
-                print("All retry attempts failed")
-                return None
-    
-    return None
+    except requests.RequestException as e:
+        logger.warning("All retry attempts failed: %s", e)
+        return None
 
 
 # ============================================
@@ -165,14 +546,56 @@ def convert_with_retry(
 # ============================================
 
 class DateConverterCache:
-    """Date converter with built-in caching."""
+    """
+    Date converter with built-in LRU caching.
     
-    def __init__(self):
-        self.cache = {}
+    Pass ``cache_name`` to also keep responses in an SQLite file via
+    requests-cache, so conversions survive process restarts. Conversions
+    never change, so stored responses do not expire; if one is expired
+    manually, requests-cache revalidates it with a conditional GET using
+    the stored ETag / Last-Modified headers.
+    """
     
-    def _generate_key(self, year: int, month: int, day: int, conv_type: str) -> str:
-        """Generate cache key."""
-        return f"{conv_type}-{year}-{month}-{day}"
+    def __init__(self, maxsize: int = 10000, cache_name: Optional[str] = None):
+        if cache_name is None:
+            self.session = _SESSION
+        elif requests_cache is None:
+            raise ImportError("requests-cache is required for cache_name: "
+                              "pip install requests-cache")
+        else:
+            self.session = requests_cache.CachedSession(
+                cache_name,
+                backend='sqlite',
+                expire_after=None
+            )
+            self.session.headers.update(_SESSION.headers)
+            self.session.mount('https://', _SharedSSLAdapter())
+        
+        # Bounded LRU keyed on the (year, month, day, conversion_type) args
+        self._convert = lru_cache(maxsize=maxsize)(self._convert_uncached)
+    
+    def _convert_uncached(
+        self, 
+        year: int, 
+        month: int, 
+        day: int, 
+        conversion_type: str
+    ) -> Dict:
+        """
+        Fetch a conversion from the API.
+        
+        Raises instead of returning None so failures are never cached.
+        """
+        url = _URL_TMPL({'ct': conversion_type, 'y': year, 'm': month, 'd': day})
+        
+        response = self.session.get(url, timeout=10)
+        response.raise_for_status()
+        
+        data = _parse_json(response)
+        
+        if data.get('success'):
+            return data['result']
+        raise ConversionError(data.get('error', 'Unknown error'))
     
     def convert(
         self, 
@@ -193,105 +616,240 @@ class DateConverterCache:
         Returns:
             Converted date dictionary or None
         """
-        key = self._generate_key(year, month, day, conversion_type)
-        
-        # Check cache first
-        if key in self.cache:
-            print("Returning cached result")
-            return self.cache[key]
-        
-        # Make API call
-        url = f"https://sudhanparajuli.com.np/api/{conversion_type}/{year}/{month}/{day}"
-        
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get('success'):
-                # Store in cache
-                self.cache[key] = data['result']
-                return data['result']
-            else:
-                print(f"Error: {data.get('error')}")
-                return None
-                
+            return self._convert(year, month, day, conversion_type)
+        except ConversionError as e:
+            logger.warning("Error: %s", e)
+            return None
         except requests.RequestException as e:
-            print(f"Request failed: {e}")
+            logger.warning("Request failed: %s", e)
             return None
     
     def clear_cache(self):
         """Clear the cache."""
-        self.cache.clear()
-        print("Cache cleared")
+        self._convert.cache_clear()
+        logger.debug("Cache cleared")
     
     def get_cache_size(self) -> int:
         """Get number of cached items."""
-        return len(self.cache)
+        return self._convert.cache_info().currsize
 
 
 # ============================================
 # 6. BATCH CONVERSION
 # ============================================
 
+def _fetch_one(
+    session: Any,
+    conversion_type: str,
+    year: int,
+    month: int,
+    day: int
+) -> Dict:
+    """
+    Convert a single date and wrap it in a batch result dictionary.
+    
+    ``session`` may be a requests.Session or an httpx.Client.
+    """
+    url = _URL_TMPL({'ct': conversion_type, 'y': year, 'm': month, 'd': day})
+    
+    try:
+        response = session.get(url, timeout=10)
+        response.raise_for_status()
+        
+        data = _parse_json(response)
+        
+        if data.get('success'):
+            return {
+                'input': {'year': year, 'month': month, 'day': day},
+                'output': data['result'],
+                'success': True
+            }
+        else:
+            return {
+                'input': {'year': year, 'month': month, 'day': day},
+                'error': data.get('error'),
+                'success': False
+            }
+            
+    except _FETCH_ERRORS as e:
+        return {
+            'input': {'year': year, 'month': month, 'day': day},
+            'error': str(e),
+            'success': False
+        }
+
+
 def convert_batch_dates(
     dates: List[Tuple[int, int, int]], 
     conversion_type: str = 'ad-to-bs',
-    delay: float = 0.1
+    delay: float = 0.1,
+    max_workers: int = 8
 ) -> List[Dict]:
     """
     Convert multiple dates in batch.
     
+    Each distinct date is requested once; requests run concurrently on a
+    thread pool and share the pooled session, so waiting on responses
+    overlaps instead of adding up.
+    
     Args:
         dates: List of (year, month, day) tuples
         conversion_type: Either 'ad-to-bs' or 'bs-to-ad'
-        delay: Delay between requests in seconds
+        delay: Minimum interval between starting requests in seconds
+            (0 disables throttling)
+        max_workers: Number of concurrent requests (keep it modest to be
+            respectful to the API)
     
     Returns:
-        List of result dictionaries
+        List of result dictionaries, in the same order as ``dates``
+    """
+    return _run_batch(_SESSION, dates, conversion_type, delay, max_workers)
+
+
+def convert_batch_dates_h2(
+    dates: List[Tuple[int, int, int]], 
+    conversion_type: str = 'ad-to-bs',
+    delay: float = 0.1,
+    max_workers: int = 8
+) -> List[Dict]:
     """
-    results = []
+    Convert multiple dates in batch over HTTP/2.
+    
+    Same as convert_batch_dates, but the requests are multiplexed over a
+    single HTTP/2 connection. Falls back to the pooled requests session
+    when httpx (with HTTP/2 support) is not installed.
     
-    for year, month, day in dates:
-        url = f"https://sudhanparajuli.com.np/api/{conversion_type}/{year}/{month}/{day}"
+    Args:
+        dates: List of (year, month, day) tuples
+        conversion_type: Either 'ad-to-bs' or 'bs-to-ad'
+        delay: Minimum interval between starting requests in seconds
+        max_workers: Number of concurrent requests
+    
+    Returns:
+        List of result dictionaries, in the same order as ``dates``
+    """
+    session = _CLIENT if _CLIENT is not None else _SESSION
+    return _run_batch(session, dates, conversion_type, delay, max_workers)
+
+
+def _copy_result(result: Dict) -> Dict:
+    """Copy a batch row so rows for duplicate dates stay independent."""
+    row = dict(result)
+    row['input'] = dict(result['input'])
+    if 'output' in row:
+        row['output'] = dict(row['output'])
+    return row
+
+
+def _run_batch(
+    session: Any,
+    dates: List[Tuple[int, int, int]],
+    conversion_type: str,
+    delay: float,
+    max_workers: int
+) -> List[Dict]:
+    """Fetch each distinct date on a thread pool, keeping the input order."""
+    by_date: Dict[Tuple[int, int, int], Dict] = {}
+    futures = {}
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        for index, key in enumerate(dict.fromkeys(dates)):
+            # Be respectful to the API: space out request starts
+            if index and delay > 0:
+                time.sleep(delay)
+            futures[ex.submit(_fetch_one, session, conversion_type, *key)] = key
         
-        try:
-            response = requests.get(url, timeout=10)
+        for future in as_completed(futures):
+            by_date[futures[future]] = future.result()
+    
+    return [_copy_result(by_date[key]) for key in dates]
+
+
+async def _fetch_one_async(
+    session: Any,
+    conversion_type: str,
+    year: int,
+    month: int,
+    day: int
+) -> Dict:
+    """Async counterpart of _fetch_one for an aiohttp.ClientSession."""
+    url = _URL_TMPL({'ct': conversion_type, 'y': year, 'm': month, 'd': day})
+    
+    try:
+        async with session.get(url) as response:
             response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get('success'):
-                results.append({
-                    'input': {'year': year, 'month': month, 'day': day},
-                    'output': data['result'],
-                    'success': True
-                })
-            else:
-                results.append({
-                    'input': {'year': year, 'month': month, 'day': day},
-                    'error': data.get('error'),
-                    'success': False
-                })
-                
-        except requests.RequestException as e:
-            results.append({
+            data = _json_loads(await response.read())
+        
+        if data.get('success'):
+            return {
                 'input': {'year': year, 'month': month, 'day': day},
-                'error': str(e),
+                'output': data['result'],
+                'success': True
+            }
+        else:
+            return {
+                'input': {'year': year, 'month': month, 'day': day},
+                'error': data.get('error'),
                 'success': False
-            })
-        
-        # Be respectful to the API
-        time.sleep(delay)
+            }
+            
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        return {
+            'input': {'year': year, 'month': month, 'day': day},
+            'error': str(e) or type(e).__name__,
+            'success': False
+        }
+
+
+async def convert_batch_dates_async(
+    dates: List[Tuple[int, int, int]], 
+    conversion_type: str = 'ad-to-bs',
+    limit: int = 50
+) -> List[Dict]:
+    """
+    Convert multiple dates in batch with asyncio and aiohttp.
+    
+    All requests run on one thread; ``limit`` caps the open connections.
+    Call it with ``asyncio.run(convert_batch_dates_async(dates))``.
     
-    return results
+    Args:
+        dates: List of (year, month, day) tuples
+        conversion_type: Either 'ad-to-bs' or 'bs-to-ad'
+        limit: Maximum number of simultaneous connections
+    
+    Returns:
+        List of result dictionaries, in the same order as ``dates``
+    
+    Raises:
+        ImportError: If aiohttp is not installed
+    """
+    if aiohttp is None:
+        raise ImportError("aiohttp is required: pip install aiohttp")
+    
+    connector = aiohttp.TCPConnector(limit=limit, keepalive_timeout=30)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        # Per-socket limits like requests' timeout=10; a total timeout would
+        # also count time spent queued behind ``limit``
+        timeout=aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=10),
+        headers=_HEADERS
+    ) as session:
+        unique = list(dict.fromkeys(dates))
+        fetched = await asyncio.gather(*[
+            _fetch_one_async(session, conversion_type, *key)
+            for key in unique
+        ])
+    
+    by_date = dict(zip(unique, fetched))
+    return [_copy_result(by_date[key]) for key in dates]
 
 
 # ============================================
 # 7. DATE VALIDATION
 # ============================================
 
+@lru_cache(maxsize=4096)
 def is_valid_ad_date(year: int, month: int, day: int) -> bool:
     """Validate AD date before API call."""
     if not (1943 <= year <= 2042):
@@ -309,6 +867,7 @@ def is_valid_ad_date(year: int, month: int, day: int) -> bool:
         return False
 
 
+@lru_cache(maxsize=4096)
 def is_valid_bs_date(year: int, month: int, day: int) -> bool:
     """Validate BS date before API call."""
     if not (2000 <= year <= 2099):
@@ -333,20 +892,20 @@ def convert_with_validation(
                 else is_valid_bs_date(year, month, day))
     
     if not is_valid:
-        print(f"Invalid date: {year}-{month}-{day}")
+        logger.warning("Invalid date: %s-%s-%s", year, month, day)
         return None
     
-    url = f"https://sudhanparajuli.com.np/api/{conversion_type}/{year}/{month}/{day}"
+    url = _URL_TMPL({'ct': conversion_type, 'y': year, 'm': month, 'd': day})
     
     try:
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         response.raise_for_status()
         
-        data = response.json()
+        data = _parse_json(response)
         return data['result'] if data.get('success') else None
         
     except requests.RequestException as e:
-        print(f"Request failed: {e}")
+        logger.warning("Request failed: %s", e)
         return None
 
 
@@ -355,14 +914,30 @@ def convert_with_validation(
 # ============================================
 
 class DateConverter:
-    """Date converter using persistent session."""
+    """
+    Date converter using persistent session.
+    
+    All instances share the module-level session, so creating converters
+    is cheap and their connections are pooled together.
+    """
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Nepali-Date-Converter-Python/1.0'
-        })
-        self.base_url = "https://sudhanparajuli.com.np/api"
+        self.base_url = _API_BASE
+    
+    @property
+    def base_url(self) -> str:
+        """API base URL; setting it rebinds the URL template."""
+        return self._base_url
+    
+    @base_url.setter
+    def base_url(self, value: str):
+        self._base_url = value
+        self._url = (value + _URL_PATH).format_map
+    
+    @property
+    def session(self) -> requests.Session:
+        """The shared module-level session."""
+        return _SESSION
     
     def convert(
         self, 
@@ -372,28 +947,46 @@ class DateConverter:
         conversion_type: str = 'ad-to-bs'
     ) -> Optional[Dict]:
         """Convert date using session."""
-        url = f"{self.base_url}/{conversion_type}/{year}/{month}/{day}"
+        url = self._url({'ct': conversion_type, 'y': year, 'm': month, 'd': day})
         
         try:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            data = _parse_json(response)
             return data['result'] if data.get('success') else None
             
         except requests.RequestException as e:
-            print(f"Request failed: {e}")
+            logger.warning("Request failed: %s", e)
             return None
     
     def close(self):
-        """Close the session."""
-        self.session.close()
+        """No-op kept for compatibility; the shared session stays open."""
 
 
 # ============================================
 # 9. FORMATTING HELPERS
 # ============================================
 
+# Common formats pre-translated to str.format templates over padded fields
+_DATE_FORMATS = {
+    'YYYY/MM/DD': '{y}/{m}/{d}',
+    'DD-MM-YYYY': '{d}-{m}-{y}',
+    'YYYY.MM.DD': '{y}.{m}.{d}',
+    'YYYY-MM-DD': '{y}-{m}-{d}',
+}
+
+# Zero-padded two-digit strings for month and day values
+_PAD2 = tuple(f"{i:02d}" for i in range(100))
+
+
+def _pad2(value) -> str:
+    """Zero-pad to two digits, using _PAD2 for ints in 0-99."""
+    if type(value) is int and 0 <= value < 100:
+        return _PAD2[value]
+    return str(value).zfill(2)
+
+
 def format_nepali_date(date_dict: Dict, format_str: str = 'YYYY/MM/DD') -> str:
     """
     Format Nepali date dictionary.
@@ -409,8 +1002,12 @@ def format_nepali_date(date_dict: Dict, format_str: str = 'YYYY/MM/DD') -> str:
         return ''
     
     year = str(date_dict['year'])
-    month = str(date_dict['month']).zfill(2)
-    day = str(date_dict['day']).zfill(2)
+    month = _pad2(date_dict['month'])
+    day = _pad2(date_dict['day'])
+    
+    template = _DATE_FORMATS.get(format_str)
+    if template is not None:
+        return template.format(y=year, m=month, d=day)
     
     return (format_str
             .replace('YYYY', year)
@@ -444,10 +1041,10 @@ def safe_convert(
     Raises:
         ConversionError: If conversion fails
     """
-    url = f"https://sudhanparajuli.com.np/api/{conversion_type}/{year}/{month}/{day}"
+    url = _URL_TMPL({'ct': conversion_type, 'y': year, 'm': month, 'd': day})
     
     try:
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         
         # Check HTTP status
         if response.status_code == 400:
@@ -459,7 +1056,7 @@ def safe_convert(
         
         response.raise_for_status()
         
-        data = response.json()
+        data = _parse_json(response)
         
         if data.get('success'):
             return data['result']
@@ -479,6 +1076,10 @@ def safe_convert(
 # ============================================
 
 if __name__ == "__main__":
+    logging.basicConfig(format='%(message)s')
+    logger.setLevel(logging.DEBUG)
+    warm_up_connection()
+    
     print("=" * 60)
     print("Nepali Date Converter - Python Examples")
     print("=" * 60)